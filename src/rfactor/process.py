@@ -1,26 +1,30 @@
-import re
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed
 from pandas import Timedelta
+from pandas.api.types import union_categoricals
 from tqdm import tqdm
 
 from rfactor.valid import valid_rainfall_timeseries
 
 
-def _days_since_start_year(series):
-    """Translate datetime series to days since start of the year
+def _days_since_start_of_record_year(timestamps):
+    """Days since the start of the year of each individual timestamp
 
     Parameters
     ----------
-    series : pd.Series
-        Series with Datetime values. All datetime values should be of the same year.
+    timestamps : numpy.ndarray
+        Array of ``datetime64[ns]`` values, possibly of different years.
 
     Returns
     -------
-    days_since_start : pd.Series
-        Days since the start of the year as a float value.
+    days_since_start : numpy.ndarray
+        Days since the start of the year of each timestamp as a float value.
+    years : numpy.ndarray
+        Year of each timestamp as ``datetime64[Y]`` values.
 
     Notes
     -----
@@ -28,16 +32,30 @@ def _days_since_start_year(series):
     is different from Pandas datetime attribute `dayofyear` as it includes time of the
     day as decimal value.
     """
-    current_year = series.dt.year.unique()
-    if not len(current_year) == 1:
-        raise Exception("Input data should all be in the same year.")
-
-    days_since_start = (
-        (series - pd.Timestamp(f"{current_year[0]}-01-01")).dt.total_seconds()
-        / 60.0
-        / 1440.0
-    )
-    return days_since_start
+    years = timestamps.astype("datetime64[Y]")
+    nanoseconds = (timestamps - years.astype("datetime64[ns]")).view("i8")
+    return nanoseconds / np.float64(86_400_000_000_000), years
+
+
+@lru_cache(maxsize=None)
+def _year_start_ns(year):
+    """Start of the year as nanoseconds since epoch
+
+    Parameters
+    ----------
+    year : str
+        Year formatted as ``YYYY``.
+
+    Returns
+    -------
+    start_ns : int
+        Nanoseconds since epoch of January 1st of the year.
+
+    Notes
+    -----
+    Cached as many files of a folder share the same year.
+    """
+    return pd.Timestamp(f"{year}-01-01").value
 
 
 def _extract_metadata_from_file_path(file_path):
@@ -56,12 +74,11 @@ def _extract_metadata_from_file_path(file_path):
     station: str
     year : str
     """
-    if not re.fullmatch(".*_[0-9]{4}$", file_path.stem):
+    station, sep, year = file_path.stem.rpartition("_")
+    if not (sep and len(year) == 4 and year.isascii() and year.isdigit()):
         raise ValueError(
             "Input file_path_format should " "match with 'STATION_NAME_YYYY.txt'"
         )
-    station = "_".join(file_path.stem.split("_")[:-1])
-    year = file_path.stem.split("_")[-1]
     return station, year
 
 
@@ -77,6 +94,26 @@ def _check_path(file_path):
             raise TypeError("`file_path` should be a pathlib.Path object")
 
 
+def _concat_columns(columns):
+    """Concatenate the values of a list of (same named) columns
+
+    Categorical columns are combined into a single categorical with the union of
+    the categories, other columns are concatenated as numpy arrays.
+
+    Parameters
+    ----------
+    columns : list of pd.Series
+        Columns to concatenate.
+
+    Returns
+    -------
+    values : numpy.ndarray or pd.Categorical
+    """
+    if isinstance(columns[0].dtype, pd.CategoricalDtype):
+        return union_categoricals(columns, sort_categories=True)
+    return np.concatenate([column.to_numpy() for column in columns])
+
+
 def load_rain_file(file_path):
     """Load (legacy Matlab) file format of rainfall data of a single station/year.
 
@@ -100,9 +137,9 @@ def load_rain_file(file_path):
         - *minutes_since* (int): Minutes since the start of the year
         - *rain_mm* (float): Rain in mm
         - *datetime* (pd.Timestamp): Time stamp
-        - *station* (str): station name
+        - *station* (category): station name
         - *year* (int): year of the measurement
-        - *tag* (str): tag identifier, formatted as ``STATION_YEAR``
+        - *tag* (category): tag identifier, formatted as ``STATION_YEAR``
 
     Example
     -------
@@ -124,19 +161,44 @@ def load_rain_file(file_path):
         )
 
     station, year = _extract_metadata_from_file_path(file_path)
-    rain = pd.read_csv(
-        file_path, delimiter=" ", header=None, names=["minutes_since", "rain_mm"]
+    data = pd.read_csv(
+        file_path,
+        sep=" ",
+        header=None,
+        names=["minutes_since", "rain_mm"],
+        dtype={"minutes_since": np.int32, "rain_mm": np.float64},
+        engine="c",
+        na_filter=False,
+        memory_map=True,
     )
-    rain["datetime"] = pd.Timestamp(f"{year}-01-01") + pd.to_timedelta(
-        pd.to_numeric(rain["minutes_since"]), unit="min"
+    minutes = data["minutes_since"].to_numpy()
+
+    # minutes since start of the year to datetime64[ns] using in-place int64
+    # arithmetic on a single buffer
+    datetime_ns = minutes.astype(np.int64)
+    datetime_ns *= np.int64(60_000_000_000)
+    datetime_ns += np.int64(_year_start_ns(year))
+    datetime = datetime_ns.view("datetime64[ns]")
+
+    # station and tag are constant for a file, stored as single category
+    codes = np.zeros(len(minutes), dtype=np.int8)
+
+    # construct all columns at once, avoiding column-wise insertion of blocks
+    rain = pd.DataFrame(
+        {
+            "minutes_since": minutes,
+            "rain_mm": data["rain_mm"].to_numpy(),
+            "datetime": datetime,
+            "station": pd.Categorical.from_codes(codes, categories=[station]),
+            "year": np.full(len(minutes), int(year), dtype=np.int64),
+            "tag": pd.Categorical.from_codes(codes, categories=[f"{station}_{year}"]),
+        },
+        copy=False,
     )
-    rain["station"] = station
-    rain["year"] = rain["datetime"].dt.year
-    rain["tag"] = rain["station"].astype(str) + "_" + rain["year"].astype(str)
     return rain
 
 
-def load_rain_folder(folder_path):
+def load_rain_folder(folder_path, n_jobs=-2):
     """Load all (legacy Matlab format) files of rainfall data in a folder
 
     Parameters
@@ -144,6 +206,9 @@ def load_rain_folder(folder_path):
     folder_path : pathlib.Path
         Folder path with rainfall data according to legacy Matlab format,
         see :func:`rfactor.process.load_rain_file`.
+    n_jobs : int, default -2
+        Number of parallel jobs used to load the individual files, see
+        :class:`joblib.Parallel`. Default all cores but one.
 
     Returns
     -------
@@ -153,9 +218,9 @@ def load_rain_folder(folder_path):
         - *minutes_since* (int): Minutes since the start of the year
         - *rain_mm* (float): Rain in mm
         - *datetime* (pd.Timestamp): Time stamp
-        - *station* (str): station name
+        - *station* (category): station name
         - *year* (int): year of the measurement
-        - *tag* (str): tag identifier, formatted as ``STATION_YEAR``
+        - *tag* (category): tag identifier, formatted as ``STATION_YEAR``
     """
     _check_path(folder_path)
     if folder_path.is_file():
@@ -163,19 +228,25 @@ def load_rain_folder(folder_path):
             "`folder_path` need to be the path " "to a directory instead of a file"
         )
 
-    lst_df = []
-
-    files = list(folder_path.glob("*.txt"))
-    for file_path in tqdm(files, total=len(files)):
-        lst_df.append(load_rain_file(file_path))
+    # files are ordered by station/year, each file being sorted in time already
+    files = sorted(folder_path.glob("*.txt"), key=_extract_metadata_from_file_path)
+    if not files:
+        raise ValueError(f"No rainfall data files ('*.txt') found in {folder_path}")
+    lst_df = Parallel(n_jobs=n_jobs)(
+        delayed(load_rain_file)(file_path)
+        for file_path in tqdm(files, total=len(files))
+    )
 
-    all_rain = pd.concat(lst_df)
-    all_rain = all_rain.sort_values(["station", "minutes_since"])
-    all_rain.index = range(len(all_rain))
+    all_rain = pd.DataFrame(
+        {
+            column: _concat_columns([df[column] for df in lst_df])
+            for column in lst_df[0].columns
+        }
+    )
     return all_rain
 
 
-def write_erosivity_data(df, folder_path):
+def write_erosivity_data(df, folder_path, n_jobs=-2):
     """Write output erosivity to (legacy Matlab format) in folder.
 
     Written data are split-up for each year and station
@@ -200,24 +271,59 @@ def write_erosivity_data(df, folder_path):
     folder_path : pathlib.Path
         Folder path to save data according to legacy Matlab format,
         see :func:`rfactor.process.load_rain_file`.
+    n_jobs : int, default -2
+        Number of parallel threads used to write the individual files, see
+        :class:`joblib.Parallel`. Default all cores but one.
 
     """
     _check_path(folder_path)
 
     folder_path.mkdir(exist_ok=True, parents=True)
 
-    for (station, year), df_group in df.groupby(["station", df["datetime"].dt.year]):
-        df_group["days_since"] = _days_since_start_year(df_group["datetime"])
-        formats = {
-            "days_since": "{:.3f}",
-            "erosivity_cum": "{:.2f}",
-            "all_event_rain_cum": "{:.1f}",
+    # days since start of the year for all records at once
+    days_since, years = _days_since_start_of_record_year(
+        df["datetime"].to_numpy(dtype="datetime64[ns]")
+    )
+
+    # split the records in contiguous station/year groups with a single sort on
+    # integer station codes and years, records without station are skipped
+    station_codes, stations = pd.factorize(df["station"], sort=True)
+    year_values = years.astype(np.int64) + 1970
+    order = np.lexsort((year_values, station_codes))
+    order = order[station_codes[order] >= 0]
+    station_codes, year_values = station_codes[order], year_values[order]
+    starts = np.flatnonzero(
+        (np.diff(station_codes, prepend=-1) != 0)
+        | (np.diff(year_values, prepend=-1) != 0)
+    )
+    stops = np.append(starts[1:], len(order))
+
+    # output columns in group order with a fixed number of decimals, formatted per
+    # value on python floats (as the legacy '{:.3f}' formatting)
+    output = pd.DataFrame(
+        {
+            "days_since": [f"{value:.3f}" for value in days_since[order].tolist()],
+            "erosivity_cum": [
+                f"{value:.2f}"
+                for value in df["erosivity_cum"].to_numpy()[order].tolist()
+            ],
+            "all_event_rain_cum": [
+                f"{value:.1f}"
+                for value in df["all_event_rain_cum"].to_numpy()[order].tolist()
+            ],
         }
-        for column, fformat in formats.items():
-            df_group[column] = df_group[column].map(lambda x: fformat.format(x))
-        df_group[["days_since", "erosivity_cum", "all_event_rain_cum"]].to_csv(
-            folder_path / f"{station}_{year}.csv", header=None, index=None, sep=" "
+    )
+
+    # each station/year is an independent file, written in parallel threads
+    Parallel(n_jobs=n_jobs, prefer="threads")(
+        delayed(output.iloc[start:stop].to_csv)(
+            folder_path / f"{stations[station_codes[start]]}_{year_values[start]}.txt",
+            header=None,
+            index=None,
+            sep=" ",
         )
+        for start, stop in zip(starts, stops)
+    )
 
 
 def get_rfactor_station_year(erosivity, stations=None, years=None):
@@ -243,7 +349,7 @@ def get_rfactor_station_year(erosivity, stations=None, years=None):
           end of *year* and at *station*.
 
     """
-
+    mask = np.ones(len(erosivity), dtype=bool)
     if stations is not None:
         unexisting_stations = set(stations).difference(
             set(erosivity["station"].unique())
@@ -252,14 +358,20 @@ def get_rfactor_station_year(erosivity, stations=None, years=None):
             raise KeyError(
                 f"Station name(s): {unexisting_stations} not part of data set."
             )
-        erosivity = erosivity.loc[erosivity["station"].isin(stations)]
+        mask &= erosivity["station"].isin(stations).to_numpy()
     if years is not None:
-        unexisting_years = set(years).difference(set(erosivity["year"].unique()))
+        year_values = erosivity["year"].to_numpy()
+        unexisting_years = set(years).difference(set(np.unique(year_values[mask])))
         if unexisting_years:
             raise KeyError(f"Year(s): {unexisting_years} not part of data set.")
-        erosivity = erosivity.loc[erosivity["year"].isin(years)]
-
-    erosivity = erosivity.groupby(["year", "station"]).aggregate("erosivity_cum").last()
+        mask &= erosivity["year"].isin(years).to_numpy()
+    if stations is not None or years is not None:
+        erosivity = erosivity.loc[mask]
+
+    # erosivity_cum is cumulative within a year, the maximum is the end-of-year value
+    erosivity = erosivity.groupby(["year", "station"], sort=False, observed=True)[
+        "erosivity_cum"
+    ].max()
     erosivity = erosivity.reset_index().sort_values(["station", "year"])
     erosivity.index = range(len(erosivity))
     return erosivity
@@ -296,26 +408,12 @@ def compute_rainfall_statistics(df_rainfall, df_station_metadata=None):
         - *max* (float): Maximal measured value for the station.
 
     """
-    df_rainfall = df_rainfall.sort_values(by="year")
-    df_statistics = (
-        df_rainfall[["year", "station", "rain_mm"]]
-        .groupby("station")
-        .aggregate(
-            {
-                "year": lambda x: sorted(set(x)),
-                "rain_mm": [np.min, np.max, np.median, "count"],
-            }
-        )
-    ).reset_index()
-    df_statistics.columns = df_statistics.columns.map("".join)
-    rename_cols = {
-        "year<lambda>": "year",
-        "rain_mmamin": "min",
-        "rain_mmamax": "max",
-        "rain_mmmedian": "median",
-        "rain_mmcount": "records",
-    }
-    df_statistics = df_statistics.rename(columns=rename_cols)
+    grouped = df_rainfall.groupby("station", observed=True)
+    df_statistics = grouped["rain_mm"].agg(
+        min="min", max="max", median="median", records="count"
+    )
+    df_statistics["year"] = grouped["year"].unique().map(sorted)
+    df_statistics = df_statistics.sort_index().reset_index()
 
     if df_station_metadata is not None:
         df_statistics = df_statistics.merge(
@@ -1,4 +1,3 @@
-import multiprocessing as mp
 from functools import partial
 
 import numpy as np
@@ -262,7 +261,7 @@ def compute_erosivity(rain, intensity_method=maximum_intensity):
 
         - *datetime* (pandas.Timestamp): Time stamp
         - *rain_mm* (float): Rain in mm
-        - *station* (str): Measurement station identifier
+        - *station* (str or category): Measurement station identifier
 
     intensity_method : Callable, default maximum_intensity
         Function to derive the maximal rain intensity (over 30min).
@@ -282,7 +281,10 @@ def compute_erosivity(rain, intensity_method=maximum_intensity):
         raise RFactorTypeError(
             "The 'datetime' column needs to be of a datetime data type."
         )
-    if not pd.core.dtypes.common.is_string_dtype(rain["station"]):
+    station_dtype = rain["station"].dtype
+    if isinstance(station_dtype, pd.CategoricalDtype):
+        station_dtype = station_dtype.categories.dtype
+    if not pd.core.dtypes.common.is_string_dtype(station_dtype):
         raise RFactorTypeError(
             "The 'station' column needs to be of a str/object data type."
         )
@@ -294,16 +296,18 @@ def compute_erosivity(rain, intensity_method=maximum_intensity):
         rain["tag"] = rain["station"].astype(str) + "_" + rain["year"].astype(str)
 
     fun_with_method = partial(_apply_rfactor, intensity_method=intensity_method)
-    grouped = rain.groupby(["station", "year"])
-    results = Parallel(n_jobs=mp.cpu_count() - 1)(
+    grouped = rain.groupby(["station", "year"], observed=True)
+    # all cores but one, at least one job
+    results = Parallel(n_jobs=-2)(
         delayed(fun_with_method)(name, group) for name, group in grouped
     )
     all_erosivity = pd.concat(results)
 
     # couple tag
-    all_erosivity = all_erosivity.merge(
-        rain[["station", "year", "tag"]].drop_duplicates(), on=["station", "year"]
-    )
+    tags = rain[["station", "year", "tag"]].drop_duplicates()
+    if isinstance(tags["tag"].dtype, pd.CategoricalDtype):
+        tags["tag"] = tags["tag"].astype(str)
+    all_erosivity = all_erosivity.merge(tags, on=["station", "year"])
     all_erosivity.index = all_erosivity["datetime"]
 
     return all_erosivity
@@ -7,7 +7,7 @@ import pytest
 
 from rfactor.process import (
     _check_path,
-    _days_since_start_year,
+    _days_since_start_of_record_year,
     _extract_metadata_from_file_path,
     compute_rainfall_statistics,
     get_rfactor_station_year,
@@ -75,21 +75,20 @@ def test_resample_rainfall(idx, values, freq, idx_n, values_n, freq_n):
 
 def test_days_since_last_year_float():
     """Moment of the day is translated as decimal number."""
-    ts_series = pd.Series(
-        pd.date_range("2021-01-01 00:00", "2021-01-02 00:00", freq="6H")
+    timestamps = pd.date_range("2021-01-01 00:00", "2021-01-02 00:00", freq="6H")
+    days_since, _ = _days_since_start_of_record_year(timestamps.to_numpy())
+    np.testing.assert_allclose(days_since, np.array([0.0, 0.25, 0.5, 0.75, 1.0]))
+
+
+def test_days_since_last_year_multiple_years():
+    """Data spanning multiple years is relative to the start of each record's year,
+    with the year of each record returned."""
+    timestamps = pd.date_range("2020-12-31 00:00", "2021-01-02 00:00", freq="12H")
+    days_since, years = _days_since_start_of_record_year(timestamps.to_numpy())
+    np.testing.assert_allclose(days_since, np.array([365.0, 365.5, 0.0, 0.5, 1.0]))
+    np.testing.assert_array_equal(
+        years.astype(int) + 1970, [2020, 2020, 2021, 2021, 2021]
     )
-    np.testing.assert_allclose(
-        _days_since_start_year(ts_series).values, np.array([0.0, 0.25, 0.5, 0.75, 1.0])
-    )
-
-
-def test_days_since_last_year_single_year():
-    """Data should all be from the same year."""
-    ts_series = pd.Series(
-        pd.date_range("2020-12-31 00:00", "2021-01-02 00:00", freq="6H")
-    )
-    with pytest.raises(Exception):
-        _days_since_start_year(ts_series)
 
 
 @pytest.mark.parametrize(
@@ -202,6 +201,49 @@ def test_load_rain_folder(rain_data_folder):
         2021,
         "station_1_2021",
     ]
+    assert (
+        rainfall_data.groupby("station", observed=True)["datetime"]
+        .apply(lambda x: x.is_monotonic_increasing)
+        .all()
+    )
+
+
+def test_load_rain_folder_multiple_years(rain_data_folder):
+    """Records of a station spanning multiple years are ordered in time"""
+    (rain_data_folder / "station_0_2021.txt").write_text("3 0.50\n600 1.00\n")
+    rainfall_data = load_rain_folder(rain_data_folder)
+    station_0 = rainfall_data[rainfall_data["station"] == "station_0"]
+    assert list(station_0["year"]) == [2020, 2020, 2020, 2021, 2021]
+    assert station_0["datetime"].is_monotonic_increasing
+    assert rainfall_data.index.equals(pd.RangeIndex(len(rainfall_data)))
+
+
+def test_load_rain_folder_categorical(rain_data_folder):
+    """Station and tag columns are categoricals with the union of the files"""
+    rainfall_data = load_rain_folder(rain_data_folder)
+    for column in ["station", "tag"]:
+        assert isinstance(rainfall_data[column].dtype, pd.CategoricalDtype)
+    assert list(rainfall_data["station"].cat.categories) == ["station_0", "station_1"]
+    assert list(rainfall_data["tag"].cat.categories) == [
+        "station_0_2020",
+        "station_1_2021",
+    ]
+
+
+def test_load_rain_folder_n_jobs(rain_data_folder):
+    """Loading files in parallel returns the same rain DataFrame"""
+    pd.testing.assert_frame_equal(
+        load_rain_folder(rain_data_folder, n_jobs=1),
+        load_rain_folder(rain_data_folder, n_jobs=2),
+    )
+
+
+def test_load_rain_folder_empty(tmp_path):
+    """When folder contains no rainfall files, should return ValueError to user"""
+    with pytest.raises(ValueError) as excinfo:
+        load_rain_folder(tmp_path)
+    assert "No rainfall data files" in str(excinfo.value)
+    assert str(tmp_path) in str(excinfo.value)
 
 
 def test_load_rain_folder_with_file(rain_data_file):
@@ -221,7 +263,7 @@ def test_write_erosivity(dummy_erosivity, tmpdir):
     write_erosivity_data(erosivity, output_dir)
 
     p = re.compile("(.*)_([0-9]{4})$")  # extract year/station from file path
-    written_files = list(sorted(output_dir.glob("*.csv")))
+    written_files = list(sorted(output_dir.glob("*.txt")))
 
     # check the written output files are split per year/station
     matched_stations = set([p.match(path.stem).group(1) for path in written_files])
@@ -236,7 +278,9 @@ def test_write_erosivity(dummy_erosivity, tmpdir):
         (erosivity["station"] == first_station)
         & (erosivity["datetime"].dt.year == int(first_year))
     ].copy()
-    original_data["days_since"] = _days_since_start_year(original_data["datetime"])
+    original_data["days_since"], _ = _days_since_start_of_record_year(
+        original_data["datetime"].to_numpy()
+    )
     written_data = pd.read_csv(
         written_files[0], delimiter=" ", names=columns_to_compare
     )
@@ -246,6 +290,37 @@ def test_write_erosivity(dummy_erosivity, tmpdir):
     )
 
 
+def test_write_erosivity_n_jobs(dummy_erosivity, tmp_path):
+    """Writing in a single or multiple threads gives the same files"""
+    written = {}
+    for n_jobs in [1, 2]:
+        output_dir = tmp_path / f"erosivity_{n_jobs}"
+        write_erosivity_data(dummy_erosivity, output_dir, n_jobs=n_jobs)
+        written[n_jobs] = {
+            path.name: path.read_text() for path in output_dir.glob("*.txt")
+        }
+    assert len(written[1]) == dummy_erosivity.groupby(["station", "year"]).ngroups
+    assert written[1] == written[2]
+
+
+def test_write_erosivity_content(tmp_path):
+    """Written columns have a fixed number of decimals, rounded as the legacy
+    Matlab format output"""
+    erosivity = pd.DataFrame(
+        {
+            # 51 days and 486 minutes, i.e. 51.3375 days
+            "datetime": pd.to_datetime(["2018-02-21 08:06:00", "2018-03-02 16:31:00"]),
+            "station": ["P01_001", "P01_001"],
+            "erosivity_cum": [4701.6, 12345.678],
+            "all_event_rain_cum": [0.0, 812.36],
+        }
+    )
+    write_erosivity_data(erosivity, tmp_path)
+
+    written_text = (tmp_path / "P01_001_2018.txt").read_text().splitlines()
+    assert written_text == ["51.337 4701.60 0.0", "60.688 12345.68 812.4"]
+
+
 def test_rfactor_from_erosivity(dummy_erosivity):
     """Latest erosivity of a station at the end of the year returns station/year
     sorted output of rfactor values"""
@@ -271,6 +346,24 @@ def test_rfactor_from_erosivity_subset(dummy_erosivity):
     assert set(station_subset["year"].unique()) == set(years_of_interest)
 
 
+@pytest.mark.parametrize("container", [set, tuple])
+def test_rfactor_from_erosivity_subset_iterable(dummy_erosivity, container):
+    """Stations/years subset can be provided as any (non-list) iterable"""
+    stations_of_interest = container(["P01_001", "P01_003"])
+    years_of_interest = container([2005, 2018])
+    subset = get_rfactor_station_year(
+        dummy_erosivity, stations=stations_of_interest, years=years_of_interest
+    )
+    reference = get_rfactor_station_year(
+        dummy_erosivity,
+        stations=list(stations_of_interest),
+        years=list(years_of_interest),
+    )
+    assert set(subset["station"].unique()) == set(stations_of_interest)
+    assert set(subset["year"].unique()) == set(years_of_interest)
+    pd.testing.assert_frame_equal(subset, reference)
+
+
 def test_rfactor_from_erosivity_subset_not_existing(dummy_erosivity):
     """Years/station subset is not part of the data set should raise Keyerror"""
 
@@ -159,6 +159,20 @@ def test_erosivity_rain_single_yearstation(dummy_rain):
     assert erosivity["tag"][0] == "P01_001_2018"
 
 
+def test_erosivity_categorical_station(dummy_rain):
+    """Erosivity calculation accepts categorical station/tag columns (as provided
+    by load_rain_file) and returns the tag as str."""
+    reference = compute_erosivity(dummy_rain.copy())
+
+    dummy_rain["station"] = dummy_rain["station"].astype("category")
+    dummy_rain["tag"] = pd.Categorical(["P01_001_2018"] * len(dummy_rain))
+    erosivity = compute_erosivity(dummy_rain)
+
+    assert erosivity["tag"].dtype == object
+    assert erosivity["tag"][0] == "P01_001_2018"
+    pd.testing.assert_frame_equal(erosivity, reference)
+
+
 def test_erosivity_rain_single_yearstation_wrong_datetime_dtype(dummy_rain):
     """Erosivity calculation with wrong datetime dtype returns error."""
     dummy_rain["datetime"] = dummy_rain["datetime"].astype(str)